@@ -0,0 +1,282 @@
+"""
+Polskie numery identyfikacyjne (PESEL, NIP, REGON) - generatory i walidatory.
+
+Moduł korzysta wyłącznie z biblioteki standardowej i jest w pełni otypowany,
+dzięki czemu można go skompilować przez mypyc (przechodzi mypy --strict):
+
+    mypy --strict polish_ids.py
+    mypyc polish_ids.py
+
+Skompilowane rozszerzenie (polish_ids.*.so / .pyd) jest importowane zamiast
+pliku .py bez zmian w kodzie wywołującym. Pseudonymizer reeksportuje
+PolishIdentifierGenerator i PolishIdentifierValidator.
+"""
+
+from __future__ import annotations
+
+import random
+
+# =============================================================================
+# Stałe
+# =============================================================================
+
+# Wagi do walidacji polskich numerów identyfikacyjnych
+PESEL_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
+NIP_WEIGHTS = (6, 5, 7, 2, 3, 4, 5, 6, 7)
+REGON_9_WEIGHTS = (8, 9, 2, 3, 4, 5, 6, 7)
+REGON_14_WEIGHTS = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
+
+
+# =============================================================================
+# Sumy kontrolne
+# =============================================================================
+
+
+def _weighted_sum(digits: list[int], weights: tuple[int, ...]) -> int:
+    """Suma ważona cyfr - wspólne jądro sum kontrolnych PESEL/NIP/REGON."""
+    total = 0
+    for digit, weight in zip(digits, weights):
+        total += digit * weight
+    return total
+
+
+# =============================================================================
+# Szybkie źródło losowości dla generatorów
+# =============================================================================
+
+_MASK_64 = (1 << 64) - 1
+
+
+class _FastRandom:
+    """
+    Lekki zamiennik random.Random (tylko randint) dla generatorów numerów.
+
+    Seed jest mieszany funkcją splitmix64, a kolejne losowania to reszty
+    z dzielenia jednego 64-bitowego stanu - bez inicjalizacji Mersenne
+    Twistera przy każdym seedzie. Zakres ~1.8e19 kombinacji w zupełności
+    wystarcza dla PESEL, NIP i REGON.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, seed: int) -> None:
+        z = (seed + 0x9E3779B97F4A7C15) & _MASK_64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        self._state = z ^ (z >> 31)
+
+    def randint(self, a: int, b: int) -> int:
+        """Zwraca liczbę całkowitą z przedziału [a, b]."""
+        self._state, value = divmod(self._state, b - a + 1)
+        return a + value
+
+
+# =============================================================================
+# Generatory poprawnych numerów identyfikacyjnych
+# =============================================================================
+
+
+class PolishIdentifierGenerator:
+    """Generator poprawnych polskich numerów identyfikacyjnych."""
+
+    @staticmethod
+    def generate_pesel(seed: int, *, fast_rng: bool = False) -> str:
+        """
+        Generuje poprawny numer PESEL z prawidłową sumą kontrolną.
+
+        Args:
+            seed: Ziarno dla generatora liczb losowych (zapewnia determinizm).
+            fast_rng: Czy użyć szybkiego generatora zamiast random.Random
+                (daje inne numery dla tego samego seeda).
+
+        Returns:
+            11-cyfrowy numer PESEL.
+        """
+        rng = _FastRandom(seed) if fast_rng else random.Random(seed)
+
+        # Data urodzenia (lata 1950-1999)
+        year = rng.randint(50, 99)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+
+        # Numer seryjny i płeć
+        serial = rng.randint(0, 999)
+        gender = rng.randint(0, 9)
+
+        digits = [
+            year // 10,
+            year % 10,
+            month // 10,
+            month % 10,
+            day // 10,
+            day % 10,
+            serial // 100,
+            (serial // 10) % 10,
+            serial % 10,
+            gender,
+        ]
+
+        # Suma kontrolna
+        checksum = _weighted_sum(digits, PESEL_WEIGHTS)
+        control_digit = (10 - (checksum % 10)) % 10
+
+        return "".join(map(str, digits + [control_digit]))
+
+    @staticmethod
+    def generate_nip(
+        seed: int, formatted: bool = True, *, fast_rng: bool = False
+    ) -> str:
+        """
+        Generuje poprawny numer NIP z prawidłową sumą kontrolną.
+
+        Args:
+            seed: Ziarno dla generatora liczb losowych.
+            formatted: Czy formatować jako XXX-XXX-XX-XX.
+            fast_rng: Czy użyć szybkiego generatora zamiast random.Random.
+
+        Returns:
+            10-cyfrowy numer NIP.
+        """
+        rng = _FastRandom(seed) if fast_rng else random.Random(seed)
+        nip_9 = [rng.randint(0, 9) for _ in range(9)]
+
+        # Suma kontrolna
+        checksum = _weighted_sum(nip_9, NIP_WEIGHTS)
+        control_digit = checksum % 11
+
+        # NIP nieprawidłowy gdy suma = 10, trzeba skorygować
+        if control_digit == 10:
+            nip_9[8] = (nip_9[8] + 1) % 10
+            checksum = _weighted_sum(nip_9, NIP_WEIGHTS)
+            control_digit = checksum % 11
+            if control_digit == 10:
+                control_digit = 0
+
+        nip_str = "".join(map(str, nip_9 + [control_digit]))
+
+        if formatted:
+            return f"{nip_str[:3]}-{nip_str[3:6]}-{nip_str[6:8]}-{nip_str[8:10]}"
+        return nip_str
+
+    @staticmethod
+    def generate_regon(seed: int, length: int = 9, *, fast_rng: bool = False) -> str:
+        """
+        Generuje poprawny numer REGON z prawidłową sumą kontrolną.
+
+        Args:
+            seed: Ziarno dla generatora liczb losowych.
+            length: Długość REGON (9 lub 14).
+            fast_rng: Czy użyć szybkiego generatora zamiast random.Random.
+
+        Returns:
+            Numer REGON o zadanej długości.
+
+        Raises:
+            ValueError: Gdy length nie jest 9 ani 14.
+        """
+        if length not in (9, 14):
+            raise ValueError(f"REGON musi mieć 9 lub 14 cyfr, podano: {length}")
+
+        rng = _FastRandom(seed) if fast_rng else random.Random(seed)
+        weights = REGON_9_WEIGHTS if length == 9 else REGON_14_WEIGHTS
+        digits_count = length - 1
+
+        digits = [rng.randint(0, 9) for _ in range(digits_count)]
+        checksum = _weighted_sum(digits, weights)
+        control_digit = checksum % 11
+
+        if control_digit == 10:
+            control_digit = 0
+
+        return "".join(map(str, digits)) + str(control_digit)
+
+
+# =============================================================================
+# Walidatory
+# =============================================================================
+
+
+class PolishIdentifierValidator:
+    """Walidator polskich numerów identyfikacyjnych."""
+
+    # Walidatory przechodzą po napisie jeden raz: pomijają spacje i myślniki,
+    # odrzucają znaki niebędące cyframi ASCII i od razu liczą sumę ważoną.
+
+    @staticmethod
+    def validate_pesel(pesel: str) -> bool:
+        """Sprawdza poprawność sumy kontrolnej PESEL."""
+        checksum = 0
+        control = 0
+        n = 0
+        for c in pesel:
+            if c in " -":
+                continue
+            v = ord(c) - 48
+            if v < 0 or v > 9:
+                return False
+            if n < 10:
+                checksum += v * PESEL_WEIGHTS[n]
+            elif n == 10:
+                control = v
+            else:
+                return False
+            n += 1
+
+        return n == 11 and (10 - (checksum % 10)) % 10 == control
+
+    @staticmethod
+    def validate_nip(nip: str) -> bool:
+        """Sprawdza poprawność sumy kontrolnej NIP."""
+        checksum = 0
+        control = 0
+        n = 0
+        for c in nip:
+            if c in " -":
+                continue
+            v = ord(c) - 48
+            if v < 0 or v > 9:
+                return False
+            if n < 9:
+                checksum += v * NIP_WEIGHTS[n]
+            elif n == 9:
+                control = v
+            else:
+                return False
+            n += 1
+
+        checksum %= 11
+        return n == 10 and checksum != 10 and checksum == control
+
+    @staticmethod
+    def validate_regon(regon: str) -> bool:
+        """Sprawdza poprawność sumy kontrolnej REGON (9 lub 14 cyfr)."""
+        # Długość znana jest dopiero na końcu, więc liczymy obie sumy naraz
+        checksum_9 = 0
+        checksum_14 = 0
+        last = 0
+        n = 0
+        for c in regon:
+            if c in " -":
+                continue
+            v = ord(c) - 48
+            if v < 0 or v > 9:
+                return False
+            if n < 8:
+                checksum_9 += v * REGON_9_WEIGHTS[n]
+            if n < 13:
+                checksum_14 += v * REGON_14_WEIGHTS[n]
+            elif n > 13:
+                return False
+            last = v
+            n += 1
+
+        if n == 9:
+            control = checksum_9 % 11
+        elif n == 14:
+            control = checksum_14 % 11
+        else:
+            return False
+
+        if control == 10:
+            control = 0
+        return control == last
@@ -9,23 +9,46 @@ Przykład użycia:
     >>> ps = Pseudonymizer()
     >>> ps.pseudonymize("Jan Kowalski, PESEL: 90010112345")
     'Tadeusz Elwart, PESEL: 97050447064'
+
+Faker i Presidio (wraz ze spaCy) są importowane dopiero przy tworzeniu
+Pseudonymizer, więc samo użycie PolishIdentifierValidator lub
+PolishIdentifierGenerator nie wymaga ich ładowania.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import random
+import re
+import threading
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from faker import Faker
-from presidio_analyzer import AnalyzerEngine, RecognizerResult
-from presidio_analyzer.nlp_engine import NlpEngineProvider
-from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
+from polish_ids import (  # noqa: F401 - reeksport dla dotychczasowych importów
+    NIP_WEIGHTS,
+    PESEL_WEIGHTS,
+    REGON_9_WEIGHTS,
+    REGON_14_WEIGHTS,
+    PolishIdentifierGenerator,
+    PolishIdentifierValidator,
+)
+
+try:
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
+
+    from faker import Faker
+    from presidio_analyzer import AnalyzerEngine, RecognizerResult
+    from presidio_analyzer.nlp_engine import NlpEngine
+    from presidio_analyzer.recognizer_registry import RecognizerRegistry
 
 # =============================================================================
 # Stałe konfiguracyjne
@@ -35,6 +58,12 @@ DEFAULT_LANGUAGE = "pl"
 DEFAULT_LOCALE = "pl_PL"
 DEFAULT_SALT = "<<<USTAW_TUTAJ_SWÓJ_SEKRETNY_SALT>>>"
 
+# Maksymalna liczba zapamiętanych zamienników (typ encji, wartość)
+REPLACEMENT_CACHE_SIZE = 100_000
+
+# Maksymalna liczba tekstów analizowanych z wyprzedzeniem w pseudonymize_stream
+STREAM_QUEUE_SIZE = 32
+
 # Ścieżki do plików konfiguracyjnych (względem tego modułu)
 _MODULE_DIR = Path(__file__).parent
 DEFAULT_NLP_CONFIG = _MODULE_DIR / "languages-config.yml"
@@ -43,11 +72,8 @@ DEFAULT_RECOGNIZERS_CONFIG = _MODULE_DIR / "recognizers-config.yml"
 # Typy encji, dla których zachowujemy wielkość liter
 CASE_SENSITIVE_ENTITIES = frozenset({"PERSON", "ORGANIZATION", "LOCATION"})
 
-# Wagi do walidacji polskich numerów identyfikacyjnych
-PESEL_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
-NIP_WEIGHTS = (6, 5, 7, 2, 3, 4, 5, 6, 7)
-REGON_9_WEIGHTS = (8, 9, 2, 3, 4, 5, 6, 7)
-REGON_14_WEIGHTS = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
+# Tablica usuwająca separatory (spacje, myślniki) z numerów identyfikacyjnych
+_ID_CLEAN_TABLE = str.maketrans("", "", " -")
 
 
 # =============================================================================
@@ -55,7 +81,7 @@ REGON_14_WEIGHTS = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Replacement:
     """Reprezentuje pojedynczą zamianę w tekście."""
 
@@ -67,7 +93,7 @@ class Replacement:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PseudonymizationResult:
     """Wynik pseudonimizacji z metadanymi."""
 
@@ -87,157 +113,117 @@ class PseudonymizationResult:
 
 
 # =============================================================================
-# Generatory poprawnych numerów identyfikacyjnych
+# Silnik analizy
 # =============================================================================
 
 
-class PolishIdentifierGenerator:
-    """Generator poprawnych polskich numerów identyfikacyjnych."""
-
-    @staticmethod
-    def generate_pesel(seed: int) -> str:
-        """
-        Generuje poprawny numer PESEL z prawidłową sumą kontrolną.
-
-        Args:
-            seed: Ziarno dla generatora liczb losowych (zapewnia determinizm).
-
-        Returns:
-            11-cyfrowy numer PESEL.
-        """
-        rng = random.Random(seed)
-
-        # Data urodzenia (lata 1950-1999)
-        year = rng.randint(50, 99)
-        month = rng.randint(1, 12)
-        day = rng.randint(1, 28)
-
-        # Numer seryjny i płeć
-        serial = rng.randint(0, 999)
-        gender = rng.randint(0, 9)
-
-        pesel_10 = f"{year:02d}{month:02d}{day:02d}{serial:03d}{gender}"
-
-        # Suma kontrolna
-        checksum = sum(int(pesel_10[i]) * PESEL_WEIGHTS[i] for i in range(10))
-        control_digit = (10 - (checksum % 10)) % 10
-
-        return pesel_10 + str(control_digit)
-
-    @staticmethod
-    def generate_nip(seed: int, formatted: bool = True) -> str:
-        """
-        Generuje poprawny numer NIP z prawidłową sumą kontrolną.
-
-        Args:
-            seed: Ziarno dla generatora liczb losowych.
-            formatted: Czy formatować jako XXX-XXX-XX-XX.
-
-        Returns:
-            10-cyfrowy numer NIP.
-        """
-        rng = random.Random(seed)
-        nip_9 = [rng.randint(0, 9) for _ in range(9)]
+_ANALYZER_LOCK = threading.Lock()
 
-        # Suma kontrolna
-        checksum = sum(nip_9[i] * NIP_WEIGHTS[i] for i in range(9))
-        control_digit = checksum % 11
+# Flagi `regex` tłumaczone na flagi inline re2; inne flagi wyłączają podmianę
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+_RE2_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
 
-        # NIP nieprawidłowy gdy suma = 10, trzeba skorygować
-        if control_digit == 10:
-            nip_9[8] = (nip_9[8] + 1) % 10
-            checksum = sum(nip_9[i] * NIP_WEIGHTS[i] for i in range(9))
-            control_digit = checksum % 11
-            if control_digit == 10:
-                control_digit = 0
 
-        nip_str = "".join(map(str, nip_9 + [control_digit]))
+class _Re2Pattern:
+    """Adapter wzorca re2 do interfejsu `regex` używanego przez PatternRecognizer."""
 
-        if formatted:
-            return f"{nip_str[:3]}-{nip_str[3:6]}-{nip_str[6:8]}-{nip_str[8:10]}"
-        return nip_str
+    __slots__ = ("_compiled",)
 
-    @staticmethod
-    def generate_regon(seed: int, length: int = 9) -> str:
-        """
-        Generuje poprawny numer REGON z prawidłową sumą kontrolną.
+    def __init__(self, compiled: re2._Regexp) -> None:
+        self._compiled = compiled
 
-        Args:
-            seed: Ziarno dla generatora liczb losowych.
-            length: Długość REGON (9 lub 14).
+    def finditer(self, text: str, timeout: float | None = None):
+        # re2 działa w czasie liniowym - limit czasu z `regex` jest zbędny
+        return self._compiled.finditer(text)
 
-        Returns:
-            Numer REGON o zadanej długości.
-
-        Raises:
-            ValueError: Gdy length nie jest 9 ani 14.
-        """
-        if length not in (9, 14):
-            raise ValueError(f"REGON musi mieć 9 lub 14 cyfr, podano: {length}")
 
-        rng = random.Random(seed)
-        weights = REGON_9_WEIGHTS if length == 9 else REGON_14_WEIGHTS
-        digits_count = length - 1
+def _compile_re2(regex: str, flags: int) -> _Re2Pattern | None:
+    """Kompiluje wzorzec do re2 lub zwraca None, gdy re2 go nie obsługuje."""
+    if flags & ~_RE2_SUPPORTED_FLAGS:
+        return None
+    inline = "".join(char for flag, char in _RE2_INLINE_FLAGS if flags & flag)
+    options = re2.Options()
+    options.log_errors = False
+    try:
+        compiled = re2.compile(f"(?{inline}){regex}" if inline else regex, options)
+    except re2.error:
+        # Np. lookbehind lub odwołania wsteczne - zostaje silnik `regex`
+        return None
+    return _Re2Pattern(compiled)
 
-        digits = [rng.randint(0, 9) for _ in range(digits_count)]
-        checksum = sum(digits[i] * weights[i] for i in range(digits_count))
-        control_digit = checksum % 11
 
-        if control_digit == 10:
-            control_digit = 0
+def _use_re2_patterns(registry: RecognizerRegistry) -> None:
+    """
+    Podmienia skompilowane wzorce PatternRecognizer na wersje re2.
 
-        return "".join(map(str, digits)) + str(control_digit)
+    Presidio kompiluje wzorce leniwie przy pierwszej analizie i używa gotowego
+    obiektu, jeśli flagi się zgadzają - wstawiamy więc wzorzec re2 z flagami
+    rozpoznawacza. Wzorce nieobsługiwane przez re2 zostają bez zmian.
+    """
+    from presidio_analyzer import PatternRecognizer
 
+    for recognizer in registry.recognizers:
+        if not isinstance(recognizer, PatternRecognizer):
+            continue
+        flags = recognizer.global_regex_flags
+        for pattern in recognizer.patterns:
+            compiled = _compile_re2(pattern.regex, flags)
+            if compiled is not None:
+                pattern.compiled_regex = compiled
+                pattern.compiled_with_flags = flags
 
-# =============================================================================
-# Walidatory
-# =============================================================================
 
+@lru_cache(maxsize=4)
+def _build_nlp_engine(nlp_config: str, nlp_config_mtime_ns: int) -> NlpEngine:
+    """
+    Tworzy silnik NLP (model spaCy) dla pliku konfiguracyjnego.
 
-class PolishIdentifierValidator:
-    """Walidator polskich numerów identyfikacyjnych."""
+    Czas modyfikacji pliku jest częścią klucza cache - zmiana YAML na dysku
+    wymusza ponowne wczytanie, a zmiana samych rozpoznawaczy już nie.
+    """
+    # Import dopiero tutaj - Presidio ładuje spaCy, co trwa sekundy
+    from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+    nlp_provider = NlpEngineProvider(conf_file=nlp_config)
+    return nlp_provider.create_engine()
+
+
+@lru_cache(maxsize=8)
+def _build_analyzer(
+    nlp_config: str,
+    nlp_config_mtime_ns: int,
+    recognizers_config: str,
+    recognizers_config_mtime_ns: int,
+    language: str,
+    use_re2: bool = False,
+) -> AnalyzerEngine:
+    """
+    Tworzy AnalyzerEngine (model spaCy + rejestr rozpoznawaczy) dla konfiguracji.
 
-    @staticmethod
-    def validate_pesel(pesel: str) -> bool:
-        """Sprawdza poprawność sumy kontrolnej PESEL."""
-        pesel_clean = pesel.replace(" ", "").replace("-", "")
-        if len(pesel_clean) != 11 or not pesel_clean.isdigit():
-            return False
+    Wynik jest zapamiętywany dla ścieżek i czasów modyfikacji plików YAML, więc
+    kolejne instancje Pseudonymizer z niezmienioną konfiguracją nie wczytują
+    ponownie YAML ani modelu spaCy. Zwrócony analizator jest współdzielony -
+    nie należy modyfikować jego rejestru (np. add_recognizer), bo zmiana
+    dotknęłaby wszystkich instancji.
+    """
+    from presidio_analyzer import AnalyzerEngine
+    from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
 
-        checksum = sum(int(pesel_clean[i]) * PESEL_WEIGHTS[i] for i in range(10))
-        control = (10 - (checksum % 10)) % 10
-        return control == int(pesel_clean[10])
+    # Inicjalizacja silnika NLP
+    nlp_engine = _build_nlp_engine(nlp_config, nlp_config_mtime_ns)
 
-    @staticmethod
-    def validate_nip(nip: str) -> bool:
-        """Sprawdza poprawność sumy kontrolnej NIP."""
-        nip_clean = nip.replace("-", "").replace(" ", "")
-        if len(nip_clean) != 10 or not nip_clean.isdigit():
-            return False
+    # Inicjalizacja rejestru rozpoznawaczy
+    registry_provider = RecognizerRegistryProvider(conf_file=recognizers_config)
+    registry = registry_provider.create_recognizer_registry()
 
-        checksum = sum(int(nip_clean[i]) * NIP_WEIGHTS[i] for i in range(9))
-        control = checksum % 11
-        return control != 10 and control == int(nip_clean[9])
+    if use_re2 and re2 is not None:
+        _use_re2_patterns(registry)
 
-    @staticmethod
-    def validate_regon(regon: str) -> bool:
-        """Sprawdza poprawność sumy kontrolnej REGON (9 lub 14 cyfr)."""
-        regon_clean = regon.replace(" ", "").replace("-", "")
-        if not regon_clean.isdigit():
-            return False
-
-        if len(regon_clean) == 9:
-            weights = REGON_9_WEIGHTS
-        elif len(regon_clean) == 14:
-            weights = REGON_14_WEIGHTS
-        else:
-            return False
-
-        checksum = sum(int(regon_clean[i]) * weights[i] for i in range(len(weights)))
-        control = checksum % 11
-        if control == 10:
-            control = 0
-        return control == int(regon_clean[-1])
+    return AnalyzerEngine(
+        registry=registry,
+        nlp_engine=nlp_engine,
+        supported_languages=[language],
+    )
 
 
 # =============================================================================
@@ -251,12 +237,13 @@ class Pseudonymizer:
 
     Wykorzystuje Presidio do wykrywania PII oraz Faker do generowania
     realistycznych zamienników. Generowanie jest deterministyczne -
-    ta sama wartość wejściowa zawsze da ten sam pseudonim.
+    ta sama wartość wejściowa zawsze da ten sam pseudonim, także gdy jedna
+    instancja jest używana równolegle z wielu wątków.
 
     Attributes:
         language: Kod języka (domyślnie "pl").
         salt: Sól kryptograficzna dla determinizmu.
-        locale: Locale dla Faker (domyślnie "pl_PL").
+        locale: Locale dla Faker (domyślnie "pl_PL", tylko do odczytu).
 
     Example:
         >>> ps = Pseudonymizer(salt="moj-sekret")
@@ -265,6 +252,44 @@ class Pseudonymizer:
         >>> print(f"Znaleziono {result.entities_found} encji")
     """
 
+    # Typ encji -> nazwa metody Faker lub funkcja (pseudonimizator, seed, oryginał)
+    _GENERATOR_SPEC: dict[str, str | Callable[[Pseudonymizer, int, str], str]] = {
+        "PERSON": "name",
+        "ORGANIZATION": "company",
+        "EMAIL_ADDRESS": "email",
+        "PHONE_NUMBER": "phone_number",
+        "PL_PHONE": "phone_number",
+        "PL_PESEL": lambda ps, seed, original: (
+            PolishIdentifierGenerator.generate_pesel(seed, fast_rng=ps._use_fast_rng)
+        ),
+        "PL_NIP": lambda ps, seed, original: (
+            PolishIdentifierGenerator.generate_nip(seed, fast_rng=ps._use_fast_rng)
+        ),
+        "PL_REGON": lambda ps, seed, original: (
+            PolishIdentifierGenerator.generate_regon(
+                seed,
+                14 if len(original.translate(_ID_CLEAN_TABLE)) > 9 else 9,
+                fast_rng=ps._use_fast_rng,
+            )
+        ),
+        "PL_ID_CARD": lambda ps, seed, original: (
+            ps._faker.bothify("???######").upper()
+        ),
+        "PL_PASSPORT": lambda ps, seed, original: (
+            ps._faker.bothify("??#######").upper()
+        ),
+        "PL_POSTAL_CODE": lambda ps, seed, original: ps._faker.numerify("##-###"),
+        "PL_BANK_ACCOUNT": lambda ps, seed, original: ps._faker.numerify(
+            "## #### #### #### #### #### ####"
+        ),
+        "IBAN_CODE": "iban",
+        "CREDIT_CARD": "credit_card_number",
+        "IP_ADDRESS": "ipv4",
+        "URL": "url",
+        "DATE_TIME": "date",
+        "LOCATION": "city",
+    }
+
     def __init__(
         self,
         *,
@@ -273,6 +298,8 @@ class Pseudonymizer:
         locale: str = DEFAULT_LOCALE,
         nlp_config_path: Path | str | None = None,
         recognizers_config_path: Path | str | None = None,
+        use_fast_rng: bool = False,
+        use_re2: bool = False,
     ) -> None:
         """
         Inicjalizuje pseudonimizator.
@@ -283,10 +310,21 @@ class Pseudonymizer:
             locale: Locale dla generatora Faker.
             nlp_config_path: Ścieżka do konfiguracji NLP (YAML).
             recognizers_config_path: Ścieżka do konfiguracji rozpoznawaczy (YAML).
+            use_fast_rng: Czy generować PESEL/NIP/REGON szybkim generatorem
+                zamiast random.Random (zmienia generowane numery).
+            use_re2: Czy dopasowywać wzorce rozpoznawaczy silnikiem re2
+                (pakiet google-re2), gdy jest zainstalowany. re2 dopasowuje
+                cyfry, białe znaki i granice słów tylko w zakresie ASCII.
         """
+        # Cache zamienników - musi istnieć przed ustawieniem soli
+        self._generate_replacement_cached = lru_cache(
+            maxsize=REPLACEMENT_CACHE_SIZE
+        )(self._build_replacement)
+
         self.language = language
         self.salt = salt
-        self.locale = locale
+        self._locale = locale
+        self._use_fast_rng = use_fast_rng
 
         # Konfiguracja ścieżek
         nlp_config = Path(nlp_config_path) if nlp_config_path else DEFAULT_NLP_CONFIG
@@ -296,74 +334,83 @@ class Pseudonymizer:
             else DEFAULT_RECOGNIZERS_CONFIG
         )
 
-        # Inicjalizacja silnika NLP
-        nlp_provider = NlpEngineProvider(conf_file=str(nlp_config))
-        nlp_engine = nlp_provider.create_engine()
+        # Analizator współdzielony między instancjami o tej samej konfiguracji
+        # (przebudowywany po zmianie plików); blokada zapobiega równoległemu
+        # ładowaniu tego samego modelu spaCy
+        with _ANALYZER_LOCK:
+            self._analyzer = _build_analyzer(
+                str(nlp_config.resolve()),
+                nlp_config.stat().st_mtime_ns,
+                str(recognizers_config.resolve()),
+                recognizers_config.stat().st_mtime_ns,
+                language,
+                use_re2,
+            )
 
-        # Inicjalizacja rejestru rozpoznawaczy
-        registry_provider = RecognizerRegistryProvider(
-            conf_file=str(recognizers_config)
-        )
-        registry = registry_provider.create_recognizer_registry()
+        from faker import Faker
 
-        # Inicjalizacja analizatora
-        self._analyzer = AnalyzerEngine(
-            registry=registry,
-            nlp_engine=nlp_engine,
-            supported_languages=[language],
-        )
+        # Współdzielona instancja Faker - seedowana przy każdym użyciu; blokada
+        # chroni parę seed + generowanie przed przeplotem między wątkami
+        self._faker: Faker = Faker(locale)
+        self._faker_lock = threading.Lock()
 
-        # Generator identyfikatorów
-        self._id_generator = PolishIdentifierGenerator()
+        # Generatory z przypiętymi metodami Faker - bez getattr przy każdej encji
+        self._dispatch: dict[str, Callable[[int, str], str]] = {
+            entity_type: self._bind_generator(spec)
+            for entity_type, spec in self._GENERATOR_SPEC.items()
+        }
+
+    def _bind_generator(
+        self, spec: str | Callable[[Pseudonymizer, int, str], str]
+    ) -> Callable[[int, str], str]:
+        """Zamienia wpis _GENERATOR_SPEC na funkcję (seed, oryginał) -> str."""
+        if isinstance(spec, str):
+            method = getattr(self._faker, spec)
+            return lambda seed, original: method()
+        return partial(spec, self)
 
     def _compute_seed(self, value: str, entity_type: str) -> int:
         """Oblicza deterministyczny seed na podstawie wartości i typu."""
-        data = f"{self.salt}{value.lower()}{entity_type}"
-        hash_hex = hashlib.sha256(data.encode("utf-8")).hexdigest()
-        return int(hash_hex[:16], 16)
+        data = f"{self.salt}{value.lower()}{entity_type}".encode("utf-8")
+        # BLAKE2b z 8-bajtowym skrótem daje 64-bitowy seed bez kodowania hex.
+        # Uwaga: zmiana z SHA-256 zmieniła wszystkie wcześniej generowane pseudonimy.
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
 
-    def _create_faker(self, seed: int) -> Faker:
-        """Tworzy seedowaną instancję Faker."""
-        fake = Faker(self.locale)
-        fake.seed_instance(seed)
-        return fake
+    @property
+    def locale(self) -> str:
+        """Locale generatora Faker, ustalane przy tworzeniu instancji."""
+        return self._locale
+
+    @property
+    def salt(self) -> str:
+        """Sól kryptograficzna; zmiana soli czyści cache zamienników."""
+        return self._salt
+
+    @salt.setter
+    def salt(self, value: str) -> None:
+        self._salt = value
+        self._generate_replacement_cached.cache_clear()
 
     def _generate_replacement(self, original: str, entity_type: str) -> str:
         """Generuje zamiennik dla danej wartości i typu encji."""
-        seed = self._compute_seed(original, entity_type)
-        fake = self._create_faker(seed)
-
-        generators: dict[str, callable] = {
-            "PERSON": fake.name,
-            "ORGANIZATION": fake.company,
-            "EMAIL_ADDRESS": fake.email,
-            "PHONE_NUMBER": fake.phone_number,
-            "PL_PHONE": fake.phone_number,
-            "PL_PESEL": lambda: self._id_generator.generate_pesel(seed),
-            "PL_NIP": lambda: self._id_generator.generate_nip(seed),
-            "PL_REGON": lambda: self._id_generator.generate_regon(
-                seed, 14 if len(original.replace(" ", "").replace("-", "")) > 9 else 9
-            ),
-            "PL_ID_CARD": lambda: fake.bothify("???######").upper(),
-            "PL_PASSPORT": lambda: fake.bothify("??#######").upper(),
-            "PL_POSTAL_CODE": lambda: fake.numerify("##-###"),
-            "PL_BANK_ACCOUNT": lambda: fake.numerify(
-                "## #### #### #### #### #### ####"
-            ),
-            "IBAN_CODE": fake.iban,
-            "CREDIT_CARD": fake.credit_card_number,
-            "IP_ADDRESS": fake.ipv4,
-            "URL": fake.url,
-            "DATE_TIME": fake.date,
-            "LOCATION": fake.city,
-        }
+        return self._generate_replacement_cached(entity_type, original.lower())
+
+    def _build_replacement(self, entity_type: str, value_key: str) -> str:
+        """
+        Generuje zamiennik na podstawie znormalizowanej wartości.
 
-        generator = generators.get(entity_type)
-        if generator:
-            return generator()
+        Wynik zależy wyłącznie od (salt, value_key, entity_type), dlatego
+        może być bezpiecznie zapamiętywany między wywołaniami.
+        """
+        generator = self._dispatch.get(entity_type)
+        if generator is None:
+            # Domyślnie: maskowanie gwiazdkami
+            return "*" * len(value_key)
 
-        # Domyślnie: maskowanie gwiazdkami
-        return "*" * len(original)
+        seed = self._compute_seed(value_key, entity_type)
+        with self._faker_lock:
+            self._faker.seed_instance(seed)
+            return generator(seed, value_key)
 
     @staticmethod
     def _match_casing(source: str, replacement: str) -> str:
@@ -372,33 +419,51 @@ class Pseudonymizer:
             return replacement.upper()
 
         words = source.split()
-        if words and all(
-            w[0].isupper() and w[1:].islower() for w in words if len(w) > 1
-        ):
-            return " ".join(w.capitalize() if w else w for w in replacement.split())
+        if not words:
+            return replacement
+
+        # Pętla z wczesnym wyjściem zamiast all(genexpr) - pierwszy wyraz
+        # niepasujący do "Wielka litera + małe" kończy sprawdzanie
+        for w in words:
+            if len(w) > 1 and not (w[0].isupper() and w[1:].islower()):
+                return replacement
 
-        return replacement
+        return " ".join(map(str.capitalize, replacement.split()))
 
     @staticmethod
     def _filter_overlapping(
         results: Sequence[RecognizerResult],
     ) -> list[RecognizerResult]:
-        """Filtruje nakładające się encje, zostawiając te z najwyższym score."""
+        """
+        Filtruje nakładające się encje, zostawiając te z najwyższym score.
+
+        Wynik jest posortowany po pozycji początkowej encji.
+        """
         if not results:
             return []
 
-        sorted_results = sorted(results, key=lambda r: r.score, reverse=True)
-        filtered: list[RecognizerResult] = []
-
-        for result in sorted_results:
-            is_overlapping = any(
-                not (result.end <= accepted.start or result.start >= accepted.end)
-                for accepted in filtered
-            )
-            if not is_overlapping:
-                filtered.append(result)
-
-        return filtered
+        # Pozycje i wyniki w równoległych listach (SoA) - jeden odczyt
+        # atrybutów na encję zamiast wielokrotnych w pętli filtrującej
+        starts = [r.start for r in results]
+        ends = [r.end for r in results]
+        scores = [r.score for r in results]
+        order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+
+        # Przyjęte przedziały są rozłączne, więc posortowane po (start, end)
+        # mają też niemalejące końce - wystarczy sprawdzić ostatni przedział
+        # zaczynający się przed końcem kandydata (wyszukiwanie binarne).
+        # Lista jest przy okazji gotowym wynikiem w kolejności tekstu.
+        accepted: list[tuple[int, int, int]] = []
+
+        for i in order:
+            start = starts[i]
+            end = ends[i]
+            idx = bisect_left(accepted, (end,))
+            if idx and accepted[idx - 1][1] > start:
+                continue
+            insort(accepted, (start, end, i))
+
+        return [results[i] for _, _, i in accepted]
 
     def analyze(self, text: str) -> list[RecognizerResult]:
         """
@@ -408,7 +473,8 @@ class Pseudonymizer:
             text: Tekst do analizy.
 
         Returns:
-            Lista wykrytych encji (bez nakładających się).
+            Lista wykrytych encji (bez nakładających się), posortowana
+            po pozycji w tekście.
         """
         results = self._analyzer.analyze(text=text, language=self.language)
         return self._filter_overlapping(results)
@@ -435,7 +501,84 @@ class Pseudonymizer:
         Returns:
             Obiekt PseudonymizationResult z tekstem i metadanymi.
         """
-        results = self.analyze(text)
+        return self._apply_replacements(text, self.analyze(text))
+
+    def pseudonymize_batch(
+        self, texts: Sequence[str], max_workers: int | None = None
+    ) -> list[PseudonymizationResult]:
+        """
+        Pseudonimizuje wiele tekstów, analizując je równolegle.
+
+        Analiza (spaCy NER) zwalnia GIL, więc wykonujemy ją w puli wątków.
+        Generowanie zamienników i składanie tekstu są tanie i wykonywane
+        sekwencyjnie, więc blokada współdzielonego Fakera nie jest obciążona.
+
+        Args:
+            texts: Teksty do pseudonimizacji.
+            max_workers: Maksymalna liczba wątków analizy (domyślnie wg
+                ThreadPoolExecutor).
+
+        Returns:
+            Lista obiektów PseudonymizationResult w kolejności wejściowej.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            analyzed = list(executor.map(self.analyze, texts))
+
+        return [
+            self._apply_replacements(text, results)
+            for text, results in zip(texts, analyzed)
+        ]
+
+    async def pseudonymize_stream(
+        self, texts: AsyncIterable[str], max_workers: int | None = None
+    ) -> AsyncIterator[PseudonymizationResult]:
+        """
+        Pseudonimizuje strumień tekstów, nakładając odczyt, analizę i zamianę.
+
+        Producent pobiera teksty ze źródła i od razu zleca ich analizę w puli
+        wątków; konsument w pętli zdarzeń czeka na kolejne wyniki i składa
+        teksty. Kolejka ogranicza liczbę tekstów analizowanych z wyprzedzeniem
+        do STREAM_QUEUE_SIZE. Zamienniki powstają wyłącznie w pętli zdarzeń,
+        więc blokada współdzielonego Fakera nie jest obciążona.
+
+        Args:
+            texts: Asynchroniczne źródło tekstów (np. plik, baza danych).
+            max_workers: Maksymalna liczba wątków analizy (domyślnie wg
+                ThreadPoolExecutor).
+
+        Yields:
+            Obiekty PseudonymizationResult w kolejności wejściowej.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+        async def produce() -> None:
+            try:
+                async for text in texts:
+                    future = loop.run_in_executor(executor, self.analyze, text)
+                    await pending.put((text, future))
+            except Exception as exc:
+                # Błąd źródła przekazujemy konsumentowi po już pobranych tekstach
+                await pending.put(exc)
+            else:
+                await pending.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (item := await pending.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                text, future = item
+                yield self._apply_replacements(text, await future)
+        finally:
+            producer.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _apply_replacements(
+        self, text: str, results: Sequence[RecognizerResult]
+    ) -> PseudonymizationResult:
+        """Generuje zamienniki dla wykrytych encji i składa nowy tekst."""
         replacements: list[Replacement] = []
         mapping: dict[tuple[str, str], str] = {}
 
@@ -463,10 +606,16 @@ class Pseudonymizer:
                 )
             )
 
-        # Zastosuj zamiany (od końca, by zachować indeksy)
-        new_text = text
-        for repl in sorted(replacements, key=lambda r: r.start, reverse=True):
-            new_text = new_text[: repl.start] + repl.replacement + new_text[repl.end :]
+        # Zbuduj nowy tekst w jednym przebiegu - encje są rozłączne
+        # i posortowane po pozycji (_filter_overlapping)
+        parts: list[str] = []
+        cursor = 0
+        for repl in replacements:
+            parts.append(text[cursor : repl.start])
+            parts.append(repl.replacement)
+            cursor = repl.end
+        parts.append(text[cursor:])
+        new_text = "".join(parts)
 
         return PseudonymizationResult(
             original_text=text,
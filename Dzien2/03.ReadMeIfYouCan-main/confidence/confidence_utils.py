@@ -73,20 +73,31 @@ def merge_confidence_values(confidence_a: dict, confidence_b: dict):
                 if conf not in (None, 0)
             ]
 
+            merged_score = (
+                score_resolver(valid_confidences) if valid_confidences else 0.0
+            )
+            merged_value = (
+                field_a["value"]
+                if field_a["confidence"] > field_b["confidence"]
+                else field_b["value"]
+            )
+            if merged_score is not None and merged_score != 0:
+                confidence_scores.append(merged_score)
+            if isinstance(merged_value, (dict, list)):
+                # Scores nested in the value count too, as they would in a
+                # `get_confidence_values` walk over the merged result
+                confidence_scores.extend(get_confidence_values(merged_value))
+
             return {
-                "confidence": (
-                    score_resolver(valid_confidences) if valid_confidences else 0.0
-                ),
-                "value": (
-                    field_a["value"]
-                    if field_a["confidence"] > field_b["confidence"]
-                    else field_b["value"]
-                ),
+                "confidence": merged_score,
+                "value": merged_value,
             }
 
+    # Non-zero merged scores, collected during the merge instead of walking the
+    # merged result again with `get_confidence_values`
+    confidence_scores = []
     merged_confidence = merge_field_confidence_value(confidence_a, confidence_b)
 
-    confidence_scores = get_confidence_values(merged_confidence)
     if confidence_scores:
         merged_confidence["_overall"] = sum(confidence_scores) / len(confidence_scores)
     else:
@@ -1,4 +1,5 @@
 import copy
+from bisect import bisect_left
 from typing import Iterable, Optional
 from azure.ai.documentintelligence.models import (
     AnalyzeResult,
@@ -162,6 +163,10 @@ def extract_lines(
 
     di_lines = list()
     for page_number, page in enumerate(analyze_result.pages):
+        # Words sorted by offset, so each span only visits the words starting
+        # inside it instead of every word on the page
+        page_words = sorted(page.words or [], key=lambda word: word.span.offset)
+        word_offsets = [word.span.offset for word in page_words]
         for line in page.lines:
             line_copy = copy.copy(line)
             contained_words = list()
@@ -169,11 +174,12 @@ def extract_lines(
                 # Find words in the page that are fully contained within the span
                 span_offset_start = span.offset
                 span_offset_end = span_offset_start + span.length
+                first = bisect_left(word_offsets, span_offset_start)
+                last = bisect_left(word_offsets, span_offset_end + 1, lo=first)
                 words_contained = [
                     word
-                    for word in page.words
-                    if word.span.offset >= span_offset_start
-                    and word.span.offset + word.span.length <= span_offset_end
+                    for word in page_words[first:last]
+                    if word.span.offset + word.span.length <= span_offset_end
                 ]
                 contained_words.extend(words_contained)
 
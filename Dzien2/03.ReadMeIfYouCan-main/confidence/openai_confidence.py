@@ -1,4 +1,5 @@
 import math
+from bisect import bisect_left, bisect_right
 from openai.types.chat.chat_completion import Choice
 from confidence.confidence_utils import get_confidence_values
 
@@ -54,6 +55,11 @@ def evaluate_confidence(extract_result: dict, choice: Choice, model: str = "gpt-
         token_offsets.append((current_pos, current_pos + token_length))
         current_pos += token_length
 
+    # Token offsets are contiguous and ascending, so the tokens covering a
+    # substring can be found by binary search instead of a linear scan
+    token_starts = [start for start, _ in token_offsets]
+    token_ends = [end for _, end in token_offsets]
+
     substr_offset = 0
 
     def find_token_indices(substring: str, start_char: int):
@@ -70,13 +76,9 @@ def evaluate_confidence(extract_result: dict, choice: Choice, model: str = "gpt-
 
         substring_length = len(substring)
         end_char = start_char + substring_length
-        indices = []
-        for idx, (start, end) in enumerate(token_offsets):
-            if start >= end_char:
-                break
-            if end > start_char:
-                indices.append(idx)
-        return indices
+        first = bisect_right(token_ends, start_char)
+        last = bisect_left(token_starts, end_char)
+        return list(range(first, last))
 
     def evaluate_field_value_confidence(value: any):
         """
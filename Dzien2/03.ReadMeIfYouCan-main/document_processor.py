@@ -8,10 +8,13 @@ using any model type registered in the model registry.
 import io
 import json
 import os
-import base64
+import hashlib
 import logging
-from typing import Dict, Any, Type, Optional, Union, List
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import threading
+from typing import Dict, Any, Type, Optional, Union, List, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial, reduce
 import importlib
 from datetime import datetime
 from dateutil import parser as date_parser
@@ -19,20 +22,39 @@ from dateutil import parser as date_parser
 from pydantic import BaseModel
 from PIL import Image
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pragma: no cover
+    pdfium = None
+
 try:
     from pdf2image import convert_from_bytes
-    from pdf2image.exceptions import PDFInfoNotInstalledError
 except ImportError:  # pragma: no cover
     convert_from_bytes = None
 
-    class PDFInfoNotInstalledError(Exception):
-        pass
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    # SIMD (AVX2/AVX-512/NEON) base64, several times faster on large pages
+    from pybase64 import b64encode
+except ImportError:  # pragma: no cover
+    from base64 import b64encode
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:  # pragma: no cover
+    cv2 = None
 
 
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import AnalyzeResult, DocumentContentFormat
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import AzureOpenAI
+from openai.types.chat import ParsedChatCompletion
 
 from models.model_registry import (
     get_model,
@@ -45,46 +67,45 @@ from confidence.document_intelligence_confidence import (
 from confidence.openai_confidence import (
     evaluate_confidence as evaluate_openai_confidence,
 )
-from confidence.confidence_utils import merge_confidence_values
-from utils.custom_json_encoder import CustomJSONEncoder
+from confidence.confidence_utils import (
+    get_confidence_values,
+    merge_confidence_values,
+)
+from utils.custom_json_encoder import CustomJSONEncoder, custom_default
 from utils.stopwatch import Stopwatch
 from utils.visualization import visualize_all_field_polygons
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Default folder for cached Document Intelligence and OpenAI responses
+DEFAULT_CACHE_DIR = "./.cache/di"
 
-def _render_pdf_to_images(document_bytes: bytes, dpi: int = 200) -> List[Image.Image]:
-    """Render a PDF (bytes) into a list of PIL Images.
-
-    Prefers `pdf2image` (Poppler) when available. Falls back to `pypdfium2`
-    to avoid requiring external Poppler binaries (notably on Windows ARM64).
-    """
-
-    if convert_from_bytes is not None:
-        try:
-            return convert_from_bytes(document_bytes, dpi=dpi)
-        except (PDFInfoNotInstalledError, FileNotFoundError, OSError) as exc:
-            logger.warning(
-                "pdf2image/Poppler unavailable (%s). Falling back to pypdfium2.",
-                str(exc),
-            )
 
-    try:
-        import pypdfium2 as pdfium  # type: ignore
-    except ImportError as exc:  # pragma: no cover
-        raise RuntimeError(
-            "PDF rendering failed. Install Poppler (for pdf2image) or install 'pypdfium2' to render PDFs without system dependencies."
-        ) from exc
+def _render_page_range(
+    document_bytes: bytes,
+    start: int,
+    end: int,
+    scale: float,
+    max_side: Optional[int] = None,
+) -> List[Image.Image]:
+    """Render pages [start, end) of a PDF with pypdfium2.
 
+    Top-level so it can run in a worker process: each worker opens its own
+    `PdfDocument`, because pdfium serializes rendering within one process.
+    Pages whose longer side would exceed `max_side` pixels are rendered at
+    a proportionally lower scale instead of being downscaled afterwards.
+    """
     pdf = pdfium.PdfDocument(document_bytes)
     images: List[Image.Image] = []
-    scale = dpi / 72.0
     try:
-        for page_index in range(len(pdf)):
+        for page_index in range(start, end):
             page = pdf[page_index]
             try:
-                bitmap = page.render(scale=scale)
+                page_scale = scale
+                if max_side:
+                    page_scale = min(scale, max_side / max(page.get_size()))
+                bitmap = page.render(scale=page_scale)
                 images.append(bitmap.to_pil())
             finally:
                 # pypdfium2 pages hold native resources
@@ -101,30 +122,383 @@ def _render_pdf_to_images(document_bytes: bytes, dpi: int = 200) -> List[Image.I
     return images
 
 
-def encode_page(page):
+def _render_pdf_to_images(
+    document_bytes: bytes,
+    dpi: int = 200,
+    max_workers: int = 1,
+    max_side: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[Image.Image]:
+    """Render a PDF (bytes) into a list of PIL Images.
+
+    Prefers `pypdfium2`, which renders in-process without external binaries,
+    subprocesses or temporary files. Falls back to `pdf2image` (Poppler) when
+    `pypdfium2` is not installed.
+
+    With `max_workers` > 1 the pages are split into contiguous ranges rendered
+    in separate processes (threads would not help - pdfium holds a global lock).
+    They run on `executor` when given, otherwise on a short-lived process pool.
+    With `max_side` set, no image side is larger than `max_side` pixels.
+    """
+
+    if pdfium is None:
+        if convert_from_bytes is None:  # pragma: no cover
+            raise RuntimeError(
+                "PDF rendering failed. Install 'pypdfium2' (recommended) or Poppler with 'pdf2image' to render PDFs."
+            )
+        images = convert_from_bytes(document_bytes, dpi=dpi)
+        if max_side:
+            for image in images:
+                image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        return images
+
+    scale = dpi / 72.0
+    pdf = pdfium.PdfDocument(document_bytes)
+    try:
+        page_count = len(pdf)
+    finally:
+        pdf.close()
+
+    workers = min(max_workers, page_count)
+    if workers <= 1:
+        return _render_page_range(document_bytes, 0, page_count, scale, max_side)
+
+    # Contiguous, nearly equal page ranges - one per worker
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    owns_executor = executor is None
+    if owns_executor:
+        executor = _new_render_pool(workers)
+    try:
+        chunks = executor.map(
+            _render_page_range,
+            [document_bytes] * workers,
+            bounds[:-1],
+            bounds[1:],
+            [scale] * workers,
+            [max_side] * workers,
+        )
+        return [image for chunk in chunks for image in chunk]
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True)
+
+
+def _new_render_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for `_render_page_range`.
+
+    Rendering is started from worker threads, and forking a multi-threaded
+    process can deadlock the child on locks held by other threads, so the
+    workers are spawned instead.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class _LazyRenderedPages(Sequence):
+    """
+    Pages of a PDF rendered on access, with the same settings as
+    `_render_pdf_to_images`.
+
+    Lets the rendered bitmaps be released once they are encoded instead of
+    staying resident during the OpenAI requests just for the visualizations.
+    """
+
+    def __init__(
+        self,
+        document_bytes: bytes,
+        page_count: int,
+        dpi: int = 200,
+        max_side: Optional[int] = None,
+    ):
+        self._document_bytes = document_bytes
+        self._page_count = page_count
+        self._scale = dpi / 72.0
+        self._max_side = max_side
+
+    def __len__(self) -> int:
+        return self._page_count
+
+    def __getitem__(self, page_index):
+        if isinstance(page_index, slice):
+            return [self[i] for i in range(*page_index.indices(self._page_count))]
+        if page_index < 0:
+            page_index += self._page_count
+        if not 0 <= page_index < self._page_count:
+            raise IndexError("page index out of range")
+        return _render_page_range(
+            self._document_bytes,
+            page_index,
+            page_index + 1,
+            self._scale,
+            self._max_side,
+        )[0]
+
+
+# MIME types of the image formats accepted by `encode_page`
+IMAGE_MIME_TYPES = {"JPEG": "image/jpeg", "PNG": "image/png"}
+
+# Data URI prefixes, built once instead of formatting them for every page
+DATA_URI_PREFIXES = {
+    image_format: f"data:{mime_type};base64,"
+    for image_format, mime_type in IMAGE_MIME_TYPES.items()
+}
+
+
+def encode_page(page, image_format="JPEG", quality=85):
     """
     Encode a PIL Image to base64 for OpenAI API.
 
+    JPEG is the default: it encodes several times faster than PNG and gives
+    much smaller payloads at a quality that is still fine for OCR.
+
     Args:
         page: A PIL Image object
+        image_format: "JPEG" (default) or "PNG" (lossless)
+        quality: JPEG quality (ignored for PNG)
+
+    Returns:
+        dict: A dictionary with the encoded image in the format required by OpenAI API
+    """
+    try:
+        image_format = image_format.upper()
+        data_uri_prefix = DATA_URI_PREFIXES.get(image_format)
+        if data_uri_prefix is None:
+            raise ValueError(f"Unsupported image format: {image_format}")
+
+        with io.BytesIO() as byte_io:
+            if image_format == "JPEG":
+                # JPEG has no alpha channel or palette
+                if page.mode not in ("RGB", "L"):
+                    page = page.convert("RGB")
+                page.save(byte_io, format="JPEG", quality=quality)
+            else:
+                page.save(byte_io, format=image_format)
+            # Encode from a zero-copy view; it must be released before close
+            with byte_io.getbuffer() as view:
+                url = data_uri_prefix + b64encode(view).decode("ascii")
+        return {
+            "type": "image_url",
+            "detail": "high",
+            "image_url": {"url": url},
+        }
+    except Exception as e:
+        logger.error("Error encoding page: %s", str(e))
+        raise
+
+
+def encode_page_np(arr, quality=85):
+    """
+    Encode an RGB (or grayscale) numpy array as a base64 JPEG for OpenAI API.
+
+    Uses OpenCV's C JPEG encoder directly on the array, skipping PIL's
+    encoder and the intermediate `BytesIO` buffer.
+
+    Args:
+        arr: An HxWx3 RGB or HxW grayscale uint8 array
+        quality: JPEG quality
 
     Returns:
         dict: A dictionary with the encoded image in the format required by OpenAI API
     """
     try:
-        byte_io = io.BytesIO()
-        page.save(byte_io, format="PNG")
-        base64_data = base64.b64encode(byte_io.getvalue()).decode("utf-8")
+        if arr.ndim == 3:
+            # OpenCV expects BGR channel order (cvtColor is much cheaper than
+            # encoding from a reversed-stride view)
+            arr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+        ok, buffer = cv2.imencode(".jpg", arr, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("OpenCV failed to encode the page as JPEG")
+        url = DATA_URI_PREFIXES["JPEG"] + b64encode(buffer).decode("ascii")
         return {
             "type": "image_url",
             "detail": "high",
-            "image_url": {"url": f"data:image/png;base64,{base64_data}"},
+            "image_url": {"url": url},
         }
     except Exception as e:
         logger.error("Error encoding page: %s", str(e))
         raise
 
 
+# Counter-clockwise quarter turns, matching the direction of Image.rotate
+QUARTER_TURN_TRANSPOSES = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Largest skew (in degrees) left uncorrected: the model reads slightly skewed
+# pages fine, and resampling a page costs far more than encoding it. This was
+# the threshold for the whole angle before quarter turns were split off, and
+# it now applies to what remains after them (an 80 degree page becomes a
+# quarter turn with -10 degrees left as is; 79 degrees is resampled by -11)
+SKEW_TOLERANCE_DEGREES = 10
+
+
+def _rotate_and_encode_page(page_num, page, angle, image_format="JPEG"):
+    """
+    Straighten a page by its detected skew angle (if significant) and encode it.
+
+    Whole quarter turns are applied with `Image.transpose` (a lossless memory
+    transpose that also keeps the full page for 90/270 degrees); only the
+    remaining skew, if larger than `SKEW_TOLERANCE_DEGREES`, is resampled. With OpenCV installed, that
+    skew correction and the JPEG encoding run on numpy arrays (vectorized
+    `warpAffine` and `imencode`). Pages that need no resampling go straight
+    to PIL, whose JPEG encoder is just as fast and needs no copy.
+
+    Args:
+        page_num: The page index (for logging)
+        page: A PIL Image object
+        angle: The page angle detected by Document Intelligence
+        image_format: Image format passed to `encode_page`
+
+    Returns:
+        dict: The encoded page as returned by `encode_page`
+    """
+    quarter_turns = round(angle / 90) * 90
+    skew = angle - quarter_turns
+    if quarter_turns % 360:
+        logger.warning("Rotating page %d by %d degrees", page_num, quarter_turns)
+        page = page.transpose(QUARTER_TURN_TRANSPOSES[quarter_turns % 360])
+
+    if abs(skew) <= SKEW_TOLERANCE_DEGREES:
+        return encode_page(page, image_format=image_format)
+
+    logger.warning("Rotating page %d by %.1f degrees", page_num, skew)
+    if cv2 is not None and image_format.upper() == "JPEG" and page.mode in ("RGB", "L"):
+        # Same result as PIL's Image.rotate: counter-clockwise around the
+        # center, nearest-neighbour sampling, black corners
+        arr = np.asarray(page)
+        height, width = arr.shape[:2]
+        center = ((width - 1) / 2, (height - 1) / 2)
+        matrix = cv2.getRotationMatrix2D(center, skew, 1.0)
+        arr = cv2.warpAffine(arr, matrix, (width, height), flags=cv2.INTER_NEAREST)
+        return encode_page_np(arr)
+
+    return encode_page(page.rotate(skew), image_format=image_format)
+
+
+def _dump_json(data):
+    """
+    Serialize results to indented JSON bytes.
+
+    Uses orjson when it is installed (several times faster than `json` with a
+    custom encoder class); dates are passed through to `custom_default` so the
+    output matches the `json` fallback, except that orjson writes NaN and
+    infinite floats as `null` where `json` writes `NaN`/`Infinity`.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=custom_default,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, indent=4, cls=CustomJSONEncoder).encode("utf-8")
+
+
+def _write_bytes(path, data):
+    """Write a whole file in one call."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+# Filename indicators of the document type, in priority order
+FILENAME_INDICATORS = (
+    ("invoice", "invoice"),
+    ("bill", "invoice"),
+    ("receipt", "invoice"),
+    ("policy", "vehicle_insurance_policy"),
+    ("insurance", "vehicle_insurance_policy"),
+)
+
+
+@lru_cache(maxsize=256)
+def _document_types_from_filename(filename):
+    """Get the document types suggested by a lowercase filename, in priority order."""
+    return tuple(
+        dict.fromkeys(
+            doc_type
+            for indicator, doc_type in FILENAME_INDICATORS
+            if indicator in filename
+        )
+    )
+
+
+DATE_KEY_MARKERS = ("date", "_from", "_to")
+
+
+def _is_date_key(key):
+    """Check whether a field name marks a date value."""
+    key = key.lower()
+    return any(marker in key for marker in DATE_KEY_MARKERS)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(value, date_format):
+    """
+    Reformat a date string, or return None if it cannot be parsed.
+
+    ISO dates are parsed with `datetime.fromisoformat` (implemented in C);
+    only other formats go through the much slower `dateutil` parser. Results
+    are cached because documents tend to repeat the same dates across fields.
+    """
+    try:
+        date = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            date = date_parser.parse(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+    return date.strftime(date_format)
+
+
+def _merge_window_values(first, second):
+    """
+    Merge values extracted from two page windows of the same document.
+
+    Nested objects are merged field by field, lists are concatenated (e.g.
+    line items) and for other values the last non-null one wins.
+    """
+    if second is None:
+        return first
+    if isinstance(first, dict) and isinstance(second, dict):
+        return {
+            key: _merge_window_values(first.get(key), second.get(key))
+            for key in {**first, **second}
+        }
+    if isinstance(first, list) and isinstance(second, list):
+        return first + second
+    return second
+
+
+def _merge_window_confidence(first, second):
+    """
+    Merge OpenAI confidence evaluations of two page windows.
+
+    Follows the same rules as `_merge_window_values`, treating
+    {"confidence", "value"} entries as single values.
+    """
+    if isinstance(second, dict) and "confidence" in second:
+        return first if second["value"] is None and first is not None else second
+    if isinstance(first, dict) and "confidence" in first:
+        # A single value followed by an object (e.g. a nested field that was
+        # null in the earlier window): the later object wins, as for values
+        return first if second is None else second
+    if isinstance(first, dict) and isinstance(second, dict):
+        return {
+            key: _merge_window_confidence(first.get(key), second.get(key))
+            for key in {**first, **second}
+            if not key.startswith("_")
+        }
+    if isinstance(first, list) and isinstance(second, list):
+        return first + second
+    return first if second is None else second
+
+
 class DocumentProcessor:
     """
     A generic processor for extracting data from documents using
@@ -149,6 +523,33 @@ class DocumentProcessor:
         self.doc_intel_client = doc_intel_client
         self.config = config
 
+        # Page rotation/encoding pool, shared by all processed documents
+        self._closed = False
+        self._encode_pool = ThreadPoolExecutor(
+            max_workers=config.get("max_workers", 4),
+            thread_name_prefix="page-encode",
+        )
+
+        # PDF render processes, started on first use and shared by all
+        # processed documents so the spawn cost is paid only once
+        render_workers = config.get("render_workers", 1)
+        self._render_pool = (
+            _new_render_pool(render_workers) if render_workers > 1 else None
+        )
+
+    def close(self) -> None:
+        """Shut down the worker threads and processes used for page processing."""
+        self._closed = True
+        self._encode_pool.shutdown(wait=True)
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=True)
+
+    def __enter__(self) -> "DocumentProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def determine_model_type(
         self, file_path: str, specified_model: Optional[str] = None
     ) -> Type[BaseModel]:
@@ -175,20 +576,11 @@ class DocumentProcessor:
         filename = os.path.basename(file_path).lower()
 
         # Check for common document type indicators in the filename
-        for indicator, doc_type in [
-            ("invoice", "invoice"),
-            ("bill", "invoice"),
-            ("receipt", "invoice"),
-            ("policy", "vehicle_insurance_policy"),
-            ("insurance", "vehicle_insurance_policy"),
-        ]:
-            if indicator in filename:
-                model_class = get_model_for_document_type(doc_type)
-                if model_class:
-                    logger.info(
-                        f"Using model '{model_class.__name__}' based on filename"
-                    )
-                    return model_class
+        for doc_type in _document_types_from_filename(filename):
+            model_class = get_model_for_document_type(doc_type)
+            if model_class:
+                logger.info(f"Using model '{model_class.__name__}' based on filename")
+                return model_class
 
         # Default to Invoice if we can't determine the type
         # This is a fallback and should be replaced with a more robust solution
@@ -226,18 +618,43 @@ class DocumentProcessor:
             with open(file_path, "rb") as document_file:
                 document_bytes = document_file.read()
 
+            # Rasterize the PDF in the background while Document Intelligence
+            # analyzes it - rendering does not depend on the DI result
+            # OpenAI downscales images beyond 2048 px anyway, so larger renders
+            # only cost encoding time and upload bandwidth
+            render_dpi = self.config.get("render_dpi", 150)
+            max_image_side = self.config.get("max_image_side", 2048)
+            render_future = self._encode_pool.submit(
+                _render_pdf_to_images,
+                document_bytes,
+                dpi=render_dpi,
+                max_workers=self.config.get("render_workers", 1),
+                max_side=max_image_side,
+                executor=self._render_pool,
+            )
+
             # Step 1: Process with Document Intelligence
             logger.info("Processing with Azure Document Intelligence...")
             di_processing_ms = 0
             with Stopwatch() as di_stopwatch:
                 try:
-                    poller = self.doc_intel_client.begin_analyze_document(
-                        model_id="prebuilt-layout",
-                        body=document_bytes,
-                        output_content_format=DocumentContentFormat.MARKDOWN,
-                        content_type="application/pdf",
+                    # Identical documents reuse the cached analysis result
+                    di_cache_path = self._cache_path(
+                        hashlib.sha256(document_bytes).hexdigest(), "di"
                     )
-                    result: AnalyzeResult = poller.result()
+                    cached_result = self._read_cache(di_cache_path)
+                    if cached_result is not None:
+                        logger.info("Using cached Document Intelligence result")
+                        result = AnalyzeResult(cached_result)
+                    else:
+                        poller = self.doc_intel_client.begin_analyze_document(
+                            model_id="prebuilt-layout",
+                            body=document_bytes,
+                            output_content_format=DocumentContentFormat.MARKDOWN,
+                            content_type="application/pdf",
+                        )
+                        result: AnalyzeResult = poller.result()
+                        self._write_cache(di_cache_path, result.as_dict())
                     di_processing_ms = di_stopwatch.elapsed_ms()
                     logger.info(
                         "Document Intelligence processing completed in %dms",
@@ -257,33 +674,51 @@ class DocumentProcessor:
             image_processing_ms = 0
             with Stopwatch() as image_stopwatch:
                 try:
-                    # Convert PDF to images
-                    orig_pages = _render_pdf_to_images(document_bytes)
-                    rotated_pages = orig_pages.copy()
-
-                    # Rotate pages based on detected angles
-                    for page_num, page in enumerate(rotated_pages):
-                        if page_num < len(result.pages):
-                            page_angle = result.pages[page_num].angle
-                            if page_angle > 10 or page_angle < -10:
-                                logger.warning(
-                                    "Rotating page %d by %d degrees",
-                                    page_num,
-                                    page_angle,
-                                )
-                                rotated_pages[page_num] = page.rotate(page_angle)
-
-                    # Process each page in parallel
-                    with ThreadPoolExecutor(
-                        max_workers=self.config.get("max_workers", 4)
-                    ) as executor:
-                        encoded_pages = list(executor.map(encode_page, rotated_pages))
+                    # Convert PDF to images (usually finished during DI analysis)
+                    orig_pages = render_future.result()
+
+                    # Skew angles detected by Document Intelligence per page
+                    page_angles = [
+                        (
+                            result.pages[page_num].angle
+                            if page_num < len(result.pages)
+                            else 0
+                        )
+                        for page_num in range(len(orig_pages))
+                    ]
+
+                    # Rotate and encode each page in one parallel pass, so the
+                    # rotated copy is released as soon as the page is encoded
+                    prepare = partial(
+                        _rotate_and_encode_page,
+                        image_format=self.config.get("image_format", "JPEG"),
+                    )
+                    encoded_pages = list(
+                        self._encode_pool.map(
+                            prepare,
+                            range(len(orig_pages)),
+                            orig_pages,
+                            page_angles,
+                        )
+                    )
+
+                    page_count = len(orig_pages)
+                    if pdfium is not None:
+                        # Only the visualizations need the bitmaps again; render
+                        # those pages on demand instead of keeping every page
+                        # in memory during the OpenAI requests
+                        orig_pages = _LazyRenderedPages(
+                            document_bytes,
+                            page_count,
+                            dpi=render_dpi,
+                            max_side=max_image_side,
+                        )
 
                     image_processing_ms = image_stopwatch.elapsed_ms()
                     logger.info(
                         "Image processing completed in %dms with %d pages",
                         image_processing_ms,
-                        len(rotated_pages),
+                        page_count,
                     )
                 except Exception as e:
                     logger.error("Image processing failed: %s", str(e))
@@ -301,6 +736,7 @@ class DocumentProcessor:
             for md_page, encoded_page in zip(md_pages, encoded_pages):
                 user_content.append({"type": "text", "text": md_page})
                 user_content.append(encoded_page)
+            del encoded_pages
 
             # Step 3: Process with OpenAI
             model_name = model_class.__name__
@@ -319,45 +755,94 @@ class DocumentProcessor:
 - Preserve date formats as shown.  
 - Extract numeric values as strings, exactly as they appear.
 """
+            # Split the pages into windows sent as parallel requests
+            # (by default all pages go into a single request)
+            pages_per_request = self.config.get("pages_per_request")
+            window_size = 2 * pages_per_request if pages_per_request else None
+            if window_size and len(user_content) > window_size:
+                windows = [
+                    user_content[i : i + window_size]
+                    for i in range(0, len(user_content), window_size)
+                ]
+            else:
+                windows = [user_content]
+
+            parse = partial(self._parse_with_openai, model_class, system_text_prompt)
             with Stopwatch() as oai_stopwatch:
                 try:
-                    completion = self.openai_client.beta.chat.completions.parse(
-                        model=self.config.get("gpt4o_model_deployment_name", "gpt-4o"),
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": system_text_prompt,
-                            },
-                            {"role": "user", "content": user_content},
-                        ],
-                        response_format=model_class,
-                        max_tokens=4096,
-                        temperature=0.0,
-                        logprobs=True,  # Enabled to determine the confidence of the response
-                    )
+                    if len(windows) == 1:
+                        completions = [parse(windows[0])]
+                    else:
+                        with ThreadPoolExecutor(
+                            max_workers=len(windows), thread_name_prefix="openai"
+                        ) as executor:
+                            completions = list(executor.map(parse, windows))
                     oai_processing_ms = oai_stopwatch.elapsed_ms()
                     logger.info(
-                        "OpenAI processing completed in %dms", oai_processing_ms
+                        "OpenAI processing completed in %dms with %d request(s)",
+                        oai_processing_ms,
+                        len(completions),
                     )
                 except Exception as e:
                     logger.error("OpenAI processing failed: %s", str(e))
                     raise
 
+            # The base64 page images are not needed past the requests
+            del user_content, windows
+
             # Step 4: Get parsed results and calculate confidence
-            document_obj = completion.choices[0].message.parsed
-            document_dict = document_obj.model_dump()
+            if len(completions) == 1:
+                document_obj = completions[0].choices[0].message.parsed
+                document_dict = document_obj.model_dump()
+            else:
+                window_dicts = [
+                    completion.choices[0].message.parsed.model_dump()
+                    for completion in completions
+                ]
+                document_obj = model_class.model_validate(
+                    reduce(_merge_window_values, window_dicts)
+                )
+                document_dict = document_obj.model_dump()
 
             # Show number of tokens used in the request
-            logger.info("Request tokens used: %d", completion.usage.prompt_tokens)
-            logger.info("Response tokens used: %d", completion.usage.completion_tokens)
+            logger.info(
+                "Request tokens used: %d",
+                sum(completion.usage.prompt_tokens for completion in completions),
+            )
+            logger.info(
+                "Response tokens used: %d",
+                sum(completion.usage.completion_tokens for completion in completions),
+            )
 
             # Calculate confidence scores
             logger.info("Calculating confidence scores...")
             di_confidence = evaluate_di_confidence(document_dict, result)
-            oai_confidence = evaluate_openai_confidence(
-                document_dict, completion.choices[0]
-            )
-            confidence = merge_confidence_values(di_confidence, oai_confidence)
+            if not self.config.get("compute_openai_confidence", True):
+                # No logprobs were requested, so only DI confidence is available
+                oai_confidence = {}
+            elif len(completions) == 1:
+                oai_confidence = evaluate_openai_confidence(
+                    document_dict, completions[0].choices[0]
+                )
+            else:
+                # Logprobs belong to each response, so evaluate per window
+                oai_confidence = reduce(
+                    _merge_window_confidence,
+                    [
+                        evaluate_openai_confidence(window_dict, completion.choices[0])
+                        for window_dict, completion in zip(window_dicts, completions)
+                    ],
+                )
+                confidence_scores = get_confidence_values(oai_confidence)
+                oai_confidence["_overall"] = (
+                    sum(confidence_scores) / len(confidence_scores)
+                    if confidence_scores
+                    else 0.0
+                )
+            if oai_confidence:
+                confidence = merge_confidence_values(di_confidence, oai_confidence)
+            else:
+                confidence = di_confidence
 
             # Step 5: Generate visualizations
             logger.info("Generating visualizations...")
@@ -406,6 +891,130 @@ class DocumentProcessor:
             logger.error("Document processing failed: %s", str(e))
             raise
 
+    def _parse_with_openai(
+        self,
+        model_class: Type[BaseModel],
+        system_text_prompt: str,
+        user_content: List[Dict[str, Any]],
+    ):
+        """
+        Run a structured-output completion for (part of) a document.
+
+        Args:
+            model_class: The model class used as the response format
+            system_text_prompt: The system prompt
+            user_content: Markdown and image parts of the pages to extract from
+
+        Returns:
+            The parsed chat completion
+        """
+        deployment_name = self.config.get("gpt4o_model_deployment_name", "gpt-4o")
+        # Logprobs are only needed to evaluate the OpenAI confidence
+        logprobs = self.config.get("compute_openai_confidence", True)
+        messages = [
+            {
+                "role": "system",
+                "content": system_text_prompt,
+            },
+            {"role": "user", "content": user_content},
+        ]
+
+        # The cache key covers everything sent in the request. Page images are
+        # hashed one by one instead of being serialized into one big JSON
+        # string, which would copy every base64 payload again.
+        request_hash = hashlib.sha256(
+            json.dumps(
+                [
+                    deployment_name,
+                    logprobs,
+                    model_class.model_json_schema(),
+                    system_text_prompt,
+                ]
+            ).encode("utf-8")
+        )
+        for part in user_content:
+            if part["type"] == "image_url":
+                request_hash.update(part["image_url"]["url"].encode("ascii"))
+            else:
+                request_hash.update(json.dumps(part).encode("utf-8"))
+        cache_path = self._cache_path(request_hash.hexdigest(), "oai")
+        response_type = ParsedChatCompletion[model_class]
+        cached_completion = self._read_cache(cache_path)
+        if cached_completion is not None:
+            logger.info("Using cached OpenAI completion")
+            return response_type.model_validate(cached_completion)
+
+        completion = self.openai_client.beta.chat.completions.parse(
+            model=deployment_name,
+            messages=messages,
+            response_format=model_class,
+            max_tokens=4096,
+            temperature=0.0,
+            logprobs=logprobs,  # Used to determine the confidence of the response
+        )
+        self._write_cache(cache_path, completion.model_dump(mode="json"))
+        return completion
+
+    def _cache_path(self, key: str, kind: str) -> Optional[str]:
+        """
+        Get the cache file path for a key, or None if caching is disabled.
+
+        Args:
+            key: A hex digest identifying the request
+            kind: The kind of cached response ("di" or "oai")
+        """
+        cache_dir = self.config.get("cache_dir", DEFAULT_CACHE_DIR)
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, f"{key}.{kind}.json")
+
+    @staticmethod
+    def _read_cache(cache_path: Optional[str]) -> Optional[Any]:
+        """Load a cached response, or return None on a cache miss."""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_cache(cache_path: Optional[str], data: Any) -> None:
+        """Store a response in the cache, atomically replacing any old entry."""
+        if cache_path is None:
+            return
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+
+    def process_documents(
+        self, file_paths: List[str], model_class: Optional[Type[BaseModel]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several documents concurrently.
+
+        Each document still needs its own Document Intelligence and OpenAI
+        requests, but they are network-bound, so documents are processed in
+        parallel threads sharing the same clients (and their connection pools).
+
+        Args:
+            file_paths: Paths to the document files
+            model_class: Optional specific model class to use for all documents
+
+        Returns:
+            list: Results of `process_document`, in the order of `file_paths`
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.config.get("max_concurrent_documents", 4),
+            thread_name_prefix="document",
+        ) as executor:
+            return list(
+                executor.map(
+                    partial(self.process_document, model_class=model_class),
+                    file_paths,
+                )
+            )
+
     def save_results(self, results: Dict[str, Any], output_folder: str) -> None:
         """
         Save processing results to output files.
@@ -429,29 +1038,26 @@ class DocumentProcessor:
             # Define output filenames
             extracted_file = os.path.join(output_folder, pdf_fname)
 
-            # Save extracted data to JSON file
-            with open(f"{extracted_file}.json", "w", encoding="utf-8") as f:
-                f.write(document.model_dump_json(indent=4))
-
-            # Save extracted data with converted dates to JSON file
             # Convert date strings in the dictionary to a consistent format
             converted_dict = self._convert_dates(document_dict)
-            with open(f"{extracted_file}_dates.json", "w", encoding="utf-8") as f:
-                f.write(json.dumps(converted_dict, indent=4, cls=CustomJSONEncoder))
 
-            # Save confidence values to JSON files
-            with open(f"{extracted_file}_di_conf.json", "w", encoding="utf-8") as f:
-                f.write(json.dumps(di_confidence, indent=4, cls=CustomJSONEncoder))
-
-            with open(f"{extracted_file}_oai_conf.json", "w", encoding="utf-8") as f:
-                f.write(json.dumps(oai_confidence, indent=4, cls=CustomJSONEncoder))
-
-            with open(f"{extracted_file}_confidence.json", "w", encoding="utf-8") as f:
-                f.write(json.dumps(confidence, indent=4, cls=CustomJSONEncoder))
+            outputs = {
+                # Extracted data
+                f"{extracted_file}.json": document.model_dump_json(indent=4).encode(),
+                # Extracted data with converted dates
+                f"{extracted_file}_dates.json": _dump_json(converted_dict),
+                # Confidence values
+                f"{extracted_file}_di_conf.json": _dump_json(di_confidence),
+                f"{extracted_file}_oai_conf.json": _dump_json(oai_confidence),
+                f"{extracted_file}_confidence.json": _dump_json(confidence),
+                # Markdown content
+                f"{extracted_file}.md": markdown.encode(),
+            }
 
-            # Save markdown content to file
-            with open(f"{extracted_file}.md", "w", encoding="utf-8") as f:
-                f.write(markdown)
+            # Write the files concurrently; list() re-raises any write error.
+            # After close() the pool is gone, so the files are written in turn
+            write_map = map if self._closed else self._encode_pool.map
+            list(write_map(_write_bytes, outputs, outputs.values()))
 
             logger.info("Results saved to %s", output_folder)
 
@@ -463,6 +1069,9 @@ class DocumentProcessor:
         """
         Convert date strings in the dictionary to a consistent format.
 
+        The input is left untouched (it is also returned to the caller as
+        `document_dict`); converted containers are built in a single pass.
+
         Args:
             dictionary: Dictionary containing extracted data
             date_format: Desired date format (default: "YYYY-MM-DD")
@@ -470,12 +1079,12 @@ class DocumentProcessor:
         Returns:
             dict: Dictionary with converted date strings
         """
-        result = dictionary.copy()
-        for key, value in result.items():
+        result = {}
+        for key, value in dictionary.items():
             if isinstance(value, dict):
-                result[key] = self._convert_dates(value, date_format)
+                value = self._convert_dates(value, date_format)
             elif isinstance(value, list):
-                result[key] = [
+                value = [
                     (
                         self._convert_dates(item, date_format)
                         if isinstance(item, dict)
@@ -483,16 +1092,9 @@ class DocumentProcessor:
                     )
                     for item in value
                 ]
-            elif isinstance(value, str):
-                # Attempt to parse and reformat date strings
-                try:
-                    if (
-                        "date" in key.lower()
-                        or "_from" in key.lower()
-                        or "_to" in key.lower()
-                    ):
-                        date = date_parser.parse(value)
-                        result[key] = date.strftime(date_format)
-                except (ValueError, TypeError):
-                    continue
+            elif isinstance(value, str) and _is_date_key(key):
+                converted = _format_date(value, date_format)
+                if converted is not None:
+                    value = converted
+            result[key] = value
         return result
@@ -6,6 +6,7 @@ of any registered model type.
 """
 
 import os
+import glob
 import logging
 import argparse
 from dotenv import load_dotenv
@@ -51,7 +52,20 @@ class Config:
         # Optional settings with defaults
         self.output_folder = os.getenv("OUTPUT_FOLDER", "./output")
         self.visualizations_folder = os.path.join(self.output_folder, "visualizations")
+        self.cache_dir = os.getenv("CACHE_DIR", "./.cache/di")
         self.max_workers = int(os.getenv("MAX_WORKERS", "4"))
+        self.image_format = os.getenv("IMAGE_FORMAT", "JPEG")
+        self.render_workers = int(os.getenv("RENDER_WORKERS", "1"))
+        self.render_dpi = int(os.getenv("RENDER_DPI", "150"))
+        self.max_image_side = int(os.getenv("MAX_IMAGE_SIDE", "2048"))
+        self.max_concurrent_documents = int(
+            os.getenv("MAX_CONCURRENT_DOCUMENTS", "4")
+        )
+        pages_per_request = os.getenv("PAGES_PER_REQUEST")
+        self.pages_per_request = int(pages_per_request) if pages_per_request else None
+        self.compute_openai_confidence = os.getenv(
+            "COMPUTE_OPENAI_CONFIDENCE", "true"
+        ).lower() in ("1", "true", "yes")
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
 
         # Set up folder structure
@@ -95,10 +109,27 @@ def initialize_clients(config):
         raise
 
 
+def log_summary(results):
+    """Log a short summary of a processed document."""
+    document = results["document"]
+    if hasattr(document, "invoice_id"):
+        logger.info("Invoice Number: %s", document.invoice_id or "N/A")
+    elif hasattr(document, "policy_number"):
+        logger.info("Policy Number: %s", document.policy_number or "N/A")
+    logger.info("Document Type: %s", results["model_type"])
+    logger.info("Confidence score: %.2f", results["confidence"].get("_overall", 0))
+    logger.info("Processing time: %dms", results["performance"]["total_ms"])
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description="Extract data from documents")
     parser.add_argument("--file", "-f", help="Path to the document file")
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        help="Paths or glob patterns of several documents to process concurrently",
+    )
     parser.add_argument(
         "--model",
         "-m",
@@ -130,7 +161,15 @@ def main():
             config={
                 "gpt4o_model_deployment_name": config.gpt4o_model_deployment_name,
                 "max_workers": config.max_workers,
+                "image_format": config.image_format,
+                "render_workers": config.render_workers,
+                "render_dpi": config.render_dpi,
+                "max_image_side": config.max_image_side,
+                "max_concurrent_documents": config.max_concurrent_documents,
+                "pages_per_request": config.pages_per_request,
                 "visualizations_folder": config.visualizations_folder,
+                "cache_dir": config.cache_dir,
+                "compute_openai_confidence": config.compute_openai_confidence,
             },
         )
 
@@ -141,28 +180,41 @@ def main():
             if not model_class:
                 logger.warning("Model '%s' not found in registry", args.model)
 
+        # Process several documents concurrently if requested
+        if args.files:
+            file_paths = list(
+                dict.fromkeys(
+                    path
+                    for pattern in args.files
+                    for path in (sorted(glob.glob(pattern)) or [pattern])
+                )
+            )
+            with processor:
+                all_results = processor.process_documents(file_paths, model_class)
+                for results in all_results:
+                    processor.save_results(results, config.output_folder)
+
+            logger.info("Processing completed successfully")
+            for results in all_results:
+                logger.info("Document: %s", results["pdf_filename"])
+                log_summary(results)
+
+            return all_results
+
         # Use default file if none provided
         file_path = args.file
         if file_path is None:
             file_path = "./assets/invoices/invoice_5.pdf"
             logger.info("Using default file path: %s", file_path)
 
-        # Process document
-        results = processor.process_document(file_path, model_class)
-
-        # Save results
-        processor.save_results(results, config.output_folder)
+        # Process document and save results; the processor owns worker threads
+        with processor:
+            results = processor.process_document(file_path, model_class)
+            processor.save_results(results, config.output_folder)
 
         # Print summary
         logger.info("Processing completed successfully")
-        document = results["document"]
-        if hasattr(document, "invoice_id"):
-            logger.info("Invoice Number: %s", document.invoice_id or "N/A")
-        elif hasattr(document, "policy_number"):
-            logger.info("Policy Number: %s", document.policy_number or "N/A")
-        logger.info("Document Type: %s", results["model_type"])
-        logger.info("Confidence score: %.2f", results["confidence"].get("_overall", 0))
-        logger.info("Processing time: %dms", results["performance"]["total_ms"])
+        log_summary(results)
 
         return results
 
@@ -5,12 +5,14 @@ This module provides a registry for document models that can be used to dynamica
 load and access all available document models in the system.
 """
 
-import inspect
 import importlib
 import os
+import pkgutil
 import sys
 import logging
-from typing import Dict, Type, Optional, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Type, Optional, Any
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,19 @@ class ModelRegistry:
 
     def __init__(self):
         self._models: Dict[str, Type[BaseModel]] = {}
+        # Read-only live view handed out by get_all_models
+        self._models_view: Mapping[str, Type[BaseModel]] = MappingProxyType(
+            self._models
+        )
+        # Field names of each model, precomputed for content matching
+        self._model_fields: Dict[str, FrozenSet[str]] = {}
+        # Lowercased model names, precomputed for document type lookups
+        self._lower_names: Dict[str, str] = {}
+        # Documents of one type keep producing the same key sets, so the best
+        # match per key set is memoized (and reset when a model is registered)
+        self._best_model_name_for_keys = lru_cache(maxsize=256)(
+            self._best_model_name
+        )
 
     def register_model(self, model_name: str, model_class: Type[BaseModel]) -> None:
         """
@@ -36,6 +51,9 @@ class ModelRegistry:
             )
 
         self._models[model_name] = model_class
+        self._model_fields[model_name] = frozenset(model_class.__annotations__)
+        self._lower_names[model_name] = model_name.lower()
+        self._best_model_name_for_keys.cache_clear()
         logger.info(f"Registered model '{model_name}'")
 
     def get_model(self, model_name: str) -> Optional[Type[BaseModel]]:
@@ -50,14 +68,17 @@ class ModelRegistry:
         """
         return self._models.get(model_name)
 
-    def get_all_models(self) -> Dict[str, Type[BaseModel]]:
+    def get_all_models(self) -> Mapping[str, Type[BaseModel]]:
         """
         Get all registered models.
 
+        Returns a read-only view instead of a copy; use `dict(get_all_models())`
+        for a mutable snapshot.
+
         Returns:
-            A dictionary mapping model names to model classes
+            A read-only mapping of model names to model classes
         """
-        return self._models.copy()
+        return self._models_view
 
     def discover_models(self, package_path: str = None) -> None:
         """
@@ -77,24 +98,28 @@ class ModelRegistry:
             logger.error(f"Package {package_name} not found in sys.modules")
             return
 
-        # Get all Python files in the package
-        for file_name in os.listdir(package_path):
-            if (
-                not file_name.endswith(".py")
-                or file_name == "__init__.py"
-                or file_name == "model_registry.py"
-            ):
+        # Get all model modules in the package (sorted by name; works for
+        # zipped and compiled packages too)
+        for _, module_basename, is_package in pkgutil.iter_modules([package_path]):
+            if is_package or module_basename == "model_registry":
                 continue
 
-            module_name = f"{package_name}.{file_name[:-3]}"  # Remove .py extension
+            module_name = f"{package_name}.{module_basename}"
 
             try:
-                # Import the module
-                module = importlib.import_module(module_name)
-
-                # Find all pydantic model classes in the module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if issubclass(obj, BaseModel) and obj.__module__ == module.__name__:
+                # Import the module, unless it is already imported
+                module = sys.modules.get(module_name) or importlib.import_module(
+                    module_name
+                )
+
+                # Find all pydantic model classes defined in the module (sorted
+                # by name, so models register in the same order as before)
+                for name, obj in sorted(vars(module).items()):
+                    if (
+                        isinstance(obj, type)
+                        and issubclass(obj, BaseModel)
+                        and obj.__module__ == module.__name__
+                    ):
                         # Register the model with its class name
                         self.register_model(name, obj)
 
@@ -120,9 +145,9 @@ class ModelRegistry:
             return self._models[document_type_lower]
 
         # Try to find a model that contains the document type in its name
-        for name, model in self._models.items():
-            if document_type_lower in name.lower():
-                return model
+        for name, lower_name in self._lower_names.items():
+            if document_type_lower in lower_name:
+                return self._models[name]
 
         # If no match found
         return None
@@ -141,25 +166,32 @@ class ModelRegistry:
         Returns:
             The best matching model class if found, None otherwise
         """
-        # Score each model based on field matches
-        scores = {}
+        best_model_name = self._best_model_name_for_keys(frozenset(content))
+        if best_model_name is None:
+            return None
+        return self._models[best_model_name]
 
-        for name, model in self._models.items():
-            score = 0
-            model_fields = model.__annotations__.keys()
+    def _best_model_name(self, content_keys: FrozenSet[str]) -> Optional[str]:
+        """
+        Get the name of the model sharing the most fields with the content keys.
 
-            # Count how many model fields appear in the content
-            for field in model_fields:
-                if field in content:
-                    score += 1
+        Args:
+            content_keys: The keys of the document content
 
-            scores[name] = score
+        Returns:
+            The best matching model name if any field matches, None otherwise
+        """
+        # Score each model by how many of its fields appear in the content
+        scores = {
+            name: len(model_fields & content_keys)
+            for name, model_fields in self._model_fields.items()
+        }
 
         # Return the model with the highest score, if any
         if scores:
             best_match = max(scores.items(), key=lambda x: x[1])
             if best_match[1] > 0:  # Ensure we have at least one field match
-                return self._models[best_match[0]]
+                return best_match[0]
 
         return None
 
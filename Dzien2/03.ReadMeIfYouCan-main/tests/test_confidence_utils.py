@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from confidence.confidence_utils import get_confidence_values, merge_confidence_values
+
+
+def _random_tree(rng, depth=0):
+    if depth > 2 or rng.random() < 0.3:
+        return None
+    tree = {}
+    for i in range(rng.randint(1, 4)):
+        kind = rng.random()
+        if kind < 0.5 or depth > 1:
+            tree[f"field_{i}"] = None
+        elif kind < 0.8:
+            tree[f"group_{i}"] = _random_tree(rng, depth + 1) or {"leaf": None}
+        else:
+            tree[f"items_{i}"] = [_random_tree(rng, depth + 1) or {"leaf": None}]
+    return tree
+
+
+def _with_scores(rng, shape):
+    if isinstance(shape, dict):
+        return {key: _with_scores(rng, value) for key, value in shape.items()}
+    if isinstance(shape, list):
+        return [_with_scores(rng, item) for item in shape]
+    return {
+        "confidence": rng.choice([None, 0, 0.0, rng.random(), rng.random()]) or 0,
+        "value": rng.choice([None, "text", 1.5]),
+    }
+
+
+class MergeConfidenceValuesTests(unittest.TestCase):
+    def test_overall_matches_walk_of_merged_result(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            shape = _random_tree(rng) or {"field": None}
+            merged = merge_confidence_values(
+                _with_scores(rng, shape), _with_scores(rng, shape)
+            )
+            overall = merged.pop("_overall")
+            scores = get_confidence_values(merged)
+            expected = sum(scores) / len(scores) if scores else 0.0
+            self.assertEqual(overall, expected)
+
+    def test_merged_fields(self):
+        merged = merge_confidence_values(
+            {
+                "name": {"confidence": 0.9, "value": "Jan"},
+                "lines": [{"amount": {"confidence": 0, "value": None}}],
+                "_overall": 0.9,
+            },
+            {
+                "name": {"confidence": 0.6, "value": "Jon"},
+                "lines": [{"amount": {"confidence": 0.5, "value": 12}}],
+                "_overall": 0.55,
+            },
+        )
+        self.assertEqual(
+            merged,
+            {
+                "name": {"confidence": 0.6, "value": "Jan"},
+                "lines": [{"amount": {"confidence": 0.5, "value": 12}}],
+                "_overall": 0.55,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
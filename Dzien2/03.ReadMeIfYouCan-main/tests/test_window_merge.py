@@ -0,0 +1,37 @@
+import unittest
+
+from document_processor import _merge_window_confidence, _merge_window_values
+
+
+class MergeWindowConfidenceTests(unittest.TestCase):
+    def setUp(self):
+        self.null_leaf = {"confidence": 0.0, "value": None}
+        self.nested = {
+            "name": {"confidence": 0.9, "value": "Jan Kowalski"},
+            "addr": {"confidence": 0.8, "value": "Warszawa"},
+        }
+
+    def test_null_then_object_keeps_later_object(self):
+        merged = _merge_window_confidence(
+            {"holder": self.null_leaf}, {"holder": self.nested}
+        )
+        self.assertEqual(merged, {"holder": self.nested})
+
+    def test_object_then_null_keeps_earlier_object(self):
+        merged = _merge_window_confidence(
+            {"holder": self.nested}, {"holder": self.null_leaf}
+        )
+        self.assertEqual(merged, {"holder": self.nested})
+
+    def test_matches_value_merge_shape(self):
+        values = _merge_window_values(
+            {"holder": None}, {"holder": {"name": "Jan Kowalski", "addr": "Warszawa"}}
+        )
+        confidence = _merge_window_confidence(
+            {"holder": self.null_leaf}, {"holder": self.nested}
+        )
+        self.assertEqual(set(values["holder"]), set(confidence["holder"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,40 @@
 import json
+from operator import attrgetter, methodcaller
+
+
+def _to_str(obj):
+    # Fallback to string representation
+    try:
+        return str(obj)
+    except Exception:
+        return f"Unserializable object of type {type(obj).__name__}"
+
+
+# Serialization handler per type, resolved on the first object of each type
+_HANDLERS = {}
+
+
+def _resolve_handler(obj):
+    # Check if object has a to_dict or __dict__ method
+    if getattr(type(obj), "to_dict", None) is not None:
+        return methodcaller("to_dict")
+    elif hasattr(obj, "__dict__"):
+        return attrgetter("__dict__")
+    # Add specific handling for DIDocumentLine if needed
+    # elif isinstance(obj, DIDocumentLine):
+    #     return lambda obj: {"some_property": obj.some_property, ...}
+    return _to_str
+
+
+def custom_default(obj):
+    obj_type = type(obj)
+    handler = _HANDLERS.get(obj_type)
+    if handler is None:
+        handler = _HANDLERS[obj_type] = _resolve_handler(obj)
+    return handler(obj)
 
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
-        # Check if object has a to_dict or __dict__ method
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        elif hasattr(obj, "__dict__"):
-            return obj.__dict__
-        # Add specific handling for DIDocumentLine if needed
-        # elif isinstance(obj, DIDocumentLine):
-        #     return {"some_property": obj.some_property, ...}
-        # Fallback to string representation
-        try:
-            return str(obj)
-        except:
-            return f"Unserializable object of type {type(obj).__name__}"
+        # Shared with orjson, which takes a plain `default` callable
+        return custom_default(obj)
@@ -1,4 +1,4 @@
-import time
+from time import perf_counter
 
 
 class Stopwatch:
@@ -10,6 +10,8 @@ class Stopwatch:
         is_running (bool): A flag indicating whether the stopwatch is running
     """
 
+    __slots__ = ("elapsed", "is_running", "start_time")
+
     def __init__(self):
         """
         Initialize a new instance of the Stopwatch class.
@@ -49,7 +51,7 @@ class Stopwatch:
             return
 
         self.is_running = True
-        self.start_time = time.perf_counter()
+        self.start_time = perf_counter()
 
     def stop(self):
         """
@@ -59,7 +61,7 @@ class Stopwatch:
             return
 
         self.is_running = False
-        self.elapsed = time.perf_counter() - self.start_time
+        self.elapsed = perf_counter() - self.start_time
 
     def get_current_elapsed(self):
         """
@@ -71,7 +73,7 @@ class Stopwatch:
         if not self.is_running:
             return self.elapsed
 
-        return time.perf_counter() - self.start_time
+        return perf_counter() - self.start_time
 
     def elapsed_ms(self):
         """
@@ -81,6 +83,5 @@ class Stopwatch:
             float: The elapsed time in milliseconds.
         """
         if self.is_running:
-            current_elapsed = time.perf_counter() - self.start_time
-            return current_elapsed * 1000
+            return (perf_counter() - self.start_time) * 1000
         return self.elapsed * 1000
@@ -1,11 +1,9 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
 from typing import Dict, Any, List, Tuple, Optional
 from PIL import Image as PILImage
-from utils.image import (
-    draw_polygon_on_pil_img,
-    flat_poly_list_to_poly_dict_list,
-    scale_flat_poly_list,
-)
+from utils.image import draw_polygons_on_pil_img, scale_flat_poly_to_tuples
 
 
 def visualize_all_field_polygons(
@@ -65,55 +63,66 @@ def visualize_all_field_polygons(
                         full_field_name, nested_field_data, polygons_by_page
                     )
 
+    # Prepare the file name prefix once for all pages; the output folder is
+    # created on the first save, so nothing is created when no page is drawn
+    output_folder_ready = False
+    # Remove extension and any path from the original filename
+    base_name = (
+        os.path.splitext(os.path.basename(original_filename))[0]
+        if original_filename
+        else None
+    )
+
     # Now create visualizations for each page
     result_images = []
-    for page_index, field_polygons in polygons_by_page.items():
-        if 0 <= page_index < len(pages):
-            # Get the image for the page
-            img_input = pages[page_index].copy()
-
-            # Draw all polygons for this page
-            for field_name, matching_line in field_polygons:
-                if (
-                    hasattr(matching_line, "normalized_polygon")
-                    and matching_line.normalized_polygon is not None
-                ):
-                    # Scale polygon to image dimensions
-                    existing_scale = (1, 1)  # Normalized scale (0-1)
-                    new_scale = (img_input.width, img_input.height)  # Pixel dimensions
-
-                    pixel_based_polygon = scale_flat_poly_list(
-                        matching_line.normalized_polygon,
-                        existing_scale=existing_scale,
-                        new_scale=new_scale,
+    save_futures = []
+    # PNG encoding releases the GIL, so pages are saved in the background while
+    # the next page is drawn; worker threads only start on the first save
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for page_index, field_polygons in polygons_by_page.items():
+            # Only lines with a normalized polygon were collected, so a page with
+            # polygons always has something to draw; others are never copied
+            if field_polygons and 0 <= page_index < len(pages):
+                # Scale the normalized (0-1) polygons to pixel dimensions
+                page = pages[page_index]
+                pixel_based_polygons = [
+                    scale_flat_poly_to_tuples(
+                        matching_line.normalized_polygon, page.width, page.height
                     )
-                    pixel_based_polygon_dict = flat_poly_list_to_poly_dict_list(
-                        pixel_based_polygon
+                    for field_name, matching_line in field_polygons
+                ]
+
+                # Draw all polygons for this page on a single copy of the image
+                img_input = draw_polygons_on_pil_img(
+                    page,
+                    pixel_based_polygons,
+                    outline_color=outline_color,
+                    outline_width=outline_width,
+                )
+
+                # Save the image with all polygons if an output folder is provided
+                if output_folder is not None:
+                    if not output_folder_ready:
+                        os.makedirs(output_folder, exist_ok=True)
+                        output_folder_ready = True
+
+                    # Create filename with original filename as prefix if provided
+                    if base_name is not None:
+                        file_name = f"{base_name}_page_{page_index}.png"
+                    else:
+                        file_name = f"page_{page_index}.png"
+
+                    output_path = os.path.join(output_folder, file_name)
+                    save_futures.append(
+                        executor.submit(img_input.save, output_path)
                     )
 
-                    # Draw the polygon on the image
-                    img_input = draw_polygon_on_pil_img(
-                        img_input,
-                        pixel_based_polygon_dict,
-                        outline_color=outline_color,
-                        outline_width=outline_width,
-                    )  # Save the image with all polygons if an output folder is provided
-            if output_folder is not None:
-                os.makedirs(output_folder, exist_ok=True)
-
-                # Create filename with original filename as prefix if provided
-                if original_filename:
-                    # Remove extension and any path from the original filename
-                    base_name = os.path.splitext(os.path.basename(original_filename))[0]
-                    file_name = f"{base_name}_page_{page_index}.png"
-                else:
-                    file_name = f"page_{page_index}.png"
-
-                output_path = os.path.join(output_folder, file_name)
-                img_input.save(output_path)
-
-            # Store the result image
-            result_images.append((f"page_{page_index}", img_input, page_index))
+                # Store the result image
+                result_images.append((f"page_{page_index}", img_input, page_index))
+
+    # Surface any error raised while saving a page
+    for future in save_futures:
+        future.result()
 
     return result_images
 
@@ -131,23 +140,19 @@ def collect_field_polygons_by_page(
         field_data: The field data containing matching_lines and page_numbers.
         polygons_by_page: Dictionary to store polygons by page.
     """
-    # Process each matching line for the field
-    for idx, matching_line in enumerate(field_data["matching_lines"]):
-        if (
-            not hasattr(matching_line, "normalized_polygon")
-            or matching_line.normalized_polygon is None
-        ):
+    matching_lines = field_data["matching_lines"]
+    page_numbers = field_data["page_numbers"]
+    if not page_numbers:
+        # No page to place the polygons on
+        return
+
+    # Process each matching line for the field; lines beyond the known page
+    # numbers are placed on the first page number
+    line_page_numbers = chain(page_numbers, repeat(page_numbers[0]))
+    for matching_line, page_index in zip(matching_lines, line_page_numbers):
+        # Skip lines without a polygon to draw
+        if getattr(matching_line, "normalized_polygon", None) is None:
             continue
 
-        # Get the page index for this matching line
-        page_index = (
-            field_data["page_numbers"][idx]
-            if idx < len(field_data["page_numbers"])
-            else field_data["page_numbers"][0]
-        )
-
         # Add this field polygon to the page's collection
-        if page_index not in polygons_by_page:
-            polygons_by_page[page_index] = []
-
-        polygons_by_page[page_index].append((field_name, matching_line))
+        polygons_by_page.setdefault(page_index, []).append((field_name, matching_line))